@@ -3,22 +3,109 @@
 Classes for creating and saving simple Scatter or Regression plots from cerebellum morphology data.
 """
 
+import io
+import os
+import re
+import time
 import shutil
 import logging
 import warnings
 from pathlib import Path
-from itertools import combinations
-from datetime import datetime
-from functools import wraps
+from itertools import combinations, chain
+from functools import wraps, lru_cache
+from contextlib import ExitStack
+from multiprocessing import get_context
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as tk
-from matplotlib.lines import Line2D
+# matplotlib is imported inside the methods that draw, so importing cbpmodels (e.g. for Scatter.xy_pairs or
+# Scatter.set_def_colors) does not pay for pyplot's backend and font setup.
 
 logger = logging.getLogger('cbpmodels.py')
 
+# matches saved figure file names, e.g. '3 Simple Plots - #12.png' -> ('3 Simple Plots', '12').
+_PNG_NAME = re.compile(r'(.+) - #(\d+)\.png')
+
+# measurement columns of all_species_values.csv, typed up front so the csv parser skips dtype inference.
+_CSV_DTYPES = {
+    'Cerebellum Surface Area': 'float64',
+    'Cerebrum Surface Area': 'float64',
+    'Cerebellum Volume': 'float64',
+    'Cerebrum Volume': 'float64',
+    }
+
+def _load_data(csv_path='all_species_values.csv') -> pd.DataFrame:
+    """Load the species dataframe from `csv_path`. A Feather snapshot of the csv is written alongside it, and read
+    instead of re-parsing the csv whenever the snapshot is at least as new as the csv. The csv is parsed with
+    pyarrow's reader where available; otherwise pandas' C parser is used, and without pyarrow no snapshot is written.
+
+    Args:
+        csv_path (str, optional): path of the species .csv file. Defaults to 'all_species_values.csv'.
+
+    Returns:
+        data (pandas.DataFrame): species dataframe.
+    """
+    csv_path = Path(csv_path)
+    feather_path = csv_path.with_suffix('.feather')
+
+    try:
+        if feather_path.stat().st_mtime >= csv_path.stat().st_mtime:
+            return pd.read_feather(feather_path)
+    except FileNotFoundError:
+        pass
+    except Exception as err:
+        # a missing pyarrow, or an unreadable (e.g. truncated) snapshot: fall back to the csv, and rewrite it.
+        logger.debug(f'\nFeather snapshot of {csv_path} was not read: {err}')
+
+    # the pyarrow engine needs pandas >= 1.4 (earlier versions raise ValueError: Unknown engine) and pyarrow itself.
+    try:
+        data = pd.read_csv(csv_path, engine='pyarrow', dtype=_CSV_DTYPES)
+    except (ImportError, ValueError):
+        data = pd.read_csv(csv_path, dtype=_CSV_DTYPES)
+
+    # written uncompressed: the file is small, and reading it back then needs no decompression step. the snapshot is
+    # written to a per-process temporary file and then moved into place, so concurrent writers (e.g. save_plots
+    # workers) never leave a partially written snapshot behind.
+    tmp_path = feather_path.with_name(f'.{feather_path.name}.{os.getpid()}.tmp')
+    try:
+        data.to_feather(tmp_path, compression='uncompressed')
+        os.replace(tmp_path, feather_path)
+    except (ImportError, OSError) as err:
+        logger.debug(f'\nFeather snapshot of {csv_path} was not written: {err}')
+        tmp_path.unlink(missing_ok=True)
+
+    return data
+
+# save naming for simple (logged=False) and log (logged=True) figures: label, save folder, details file.
+_SAVE_NAMES = {
+    False: ('Simple', 'Saved Simple Plots', 'SIMPLE_PLOT_DETAILS.txt'),
+    True: ('Log', 'Saved Log Plots', 'LOG_PLOT_DETAILS.txt'),
+    }
+
+# figure creation time format used in the plot-details files.
+_TIMESTAMP_FORMAT = '%d-%m-%Y at %H:%M:%S'
+
+# PNG options for saved figures. low zlib compression; encoding at the default level dominates savefig time for
+# multi-plot figures.
+_PNG_KWARGS = {'compress_level': 1}
+
+def _init_render_worker(data: pd.DataFrame) -> None:
+    """Initialise a save_plots worker process: use the parent's Scatter.DATA, and the non-interactive Agg backend."""
+    import matplotlib
+    matplotlib.use('Agg')
+    Scatter.DATA = data
+
+def _render_png(figure) -> bytes:
+    """Plot a Scatter instance and return the figure encoded as PNG, for writing to disk by the parent process."""
+    import matplotlib.pyplot as plt
+
+    fig = figure._figure()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', pil_kwargs=_PNG_KWARGS)
+    plt.close(fig)
+
+    return buffer.getvalue()
+
 class Scatter(object):
     """Class for creating fully-constructed scatter plots with matplotlib.pyplot, intended for use within the
     Cerebellum Project. Facilitates creation of mutliple plots at once, with autonomous axes label and legend creation,
@@ -34,8 +121,9 @@ class Scatter(object):
             Used when no arguments are passed to property `xy`, or variables cannot be plotted/combined with those
             arguments.
         __instances: list of class instances, for use when displaying or saving all instances.
+        __handles: cache of main legend handles, keyed by marker, edgecolor, color map and emphasis.
     """
-    DATA = pd.read_csv('all_species_values.csv')
+    DATA = _load_data('all_species_values.csv')
 
     ORIGINAL_COLORS = {
                 'Hominidae': '#7f48b5',
@@ -46,6 +134,7 @@ class Scatter(object):
     new_def_colors = ORIGINAL_COLORS.copy()
     def_pairs = 4, 3, 1
     __instances = []
+    __handles = {}
     
     def __init__(self, xy=None, colors=None, logged=False, *, figsize=None, grid=None, edgecolor='k', marker='o', 
                 title=None, legend_loc='upper left', species_means=False, family_means=False, overlay_means=False):
@@ -65,7 +154,8 @@ class Scatter(object):
             edgecolor (str, optional): The border color of each data-point. Defaults to 'k' (black).
             marker (str, optional): The marker style of each data-point. Defaults to 'o' (circle).
             title (str, optional): Main title of the figure. Defaults to None.
-            legend_loc (str, optional): Location of the legend on each plot. Defaults to 'upper left'.
+            legend_loc (str, optional): Location of the family legend, drawn on the first axis of the figure.
+                Defaults to 'upper left'.
         
         matplotlib named colors: https://matplotlib.org/stable/gallery/color/named_colors.html
         """
@@ -103,15 +193,20 @@ class Scatter(object):
 
     @xy.setter
     def xy(self, cols_or_pairs):
+        # whether the pairs are the default combinations is recorded here, for naming saved figures.
         if cols_or_pairs is None:
             xy = Scatter.xy_pairs(Scatter.def_pairs)
+            is_default = True
         else:
             try:
                 xy = [[str(var) for var in tuples] for tuples in cols_or_pairs]
+                is_default = False
             except TypeError:
                 xy = Scatter.xy_pairs(cols_or_pairs)
+                is_default = xy == Scatter.xy_pairs(Scatter.def_pairs)
 
         self._xy = xy
+        self._is_default_xy = is_default
 
     @property
     def colors(self) -> dict[str, str]:
@@ -236,15 +331,14 @@ class Scatter(object):
             logger.debug(f'\nValueError: non-int was passed to cols: {cols}')
             raise ValueError('xy_pairs() does not accept floating-point or alpha character values.\n') from None
 
-        invalid_cols = []    
-        for col_idx in cols:
-            if (
-                col_idx >= len(Scatter.DATA.columns)
-                or Scatter.DATA[Scatter.DATA.columns[col_idx]].dtype != ('float64' or 'int64')
-            ):
-                invalid_cols.append(col_idx)
+        # single pass over column dtypes; accepts floating-point and (unsigned) integer columns.
+        numeric_mask = np.array([dtype.kind in 'fiu' for dtype in Scatter.DATA.dtypes], dtype=bool)
+        col_arr = np.asarray(cols, dtype=np.intp)
+        in_range = (col_arr >= 0) & (col_arr < numeric_mask.size)
+        valid = in_range & numeric_mask[np.where(in_range, col_arr, 0)]
 
-        valid_cols = [col_idx for col_idx in cols if col_idx not in invalid_cols]
+        invalid_cols = col_arr[~valid].tolist()
+        valid_cols = col_arr[valid].tolist()
 
         try:
             if len(valid_cols) >= 2:
@@ -261,8 +355,7 @@ class Scatter(object):
                         f' against one another: {dupes}.\n'
                         )
 
-                # dict.fromkeys retains order of col indices.
-                xy_pairs = tuple(combinations(Scatter.DATA.columns[list(dict.fromkeys(valid_cols))], 2))
+                xy_pairs = Scatter._column_pairs(tuple(valid_cols), tuple(Scatter.DATA.columns))
             else:
                 raise ValueError
 
@@ -274,10 +367,26 @@ class Scatter(object):
                 f'Please ensure the list has at least 2 valid indices, where such indices refer to columns'
                 f' containing floating-point numbers or integers.\n'
                 )
-            xy_pairs = tuple(combinations(Scatter.DATA.columns[list(dict.fromkeys(Scatter.def_pairs))], 2))
+            xy_pairs = Scatter._column_pairs(tuple(Scatter.def_pairs), tuple(Scatter.DATA.columns))
         
         return xy_pairs
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _column_pairs(cols: tuple[int, ...], columns: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        """Get all pairwise combinations of the column names at indices `cols`, ignoring repeated indices. Cached on
+        both arguments, so repeated (e.g. default) pairs are only combined once per set of dataframe columns.
+
+        Args:
+            cols (tuple of int): valid column index values.
+            columns (tuple of str): column names of the dataframe that `cols` index into.
+
+        Returns:
+            column_pairs: tuple of tuples, each containing independent/dependent variable pairs.
+        """
+        # dict.fromkeys retains order of col indices.
+        return tuple(combinations((columns[col_idx] for col_idx in dict.fromkeys(cols)), 2))
+
     def emphasize(self, species_or_fam_name, **kwargs):
         """highlights the data points exclusive to `species_or_fam_name`, by reducing the alpha value of all other 
         points to `alpha_value`, increasing marker size to `s`, and increasing line width to `linewidth`.
@@ -307,6 +416,8 @@ class Scatter(object):
         def wrapper(self, species_or_fam_name, with_highlight=True, color=None, edgecolor=None,
             alpha=0.2, s=None, linewidth=1.5, with_arrows=False, scientific_name=True, legend=True):
             
+            from matplotlib.lines import Line2D
+
             # get the rank column name (Species or Family) for the name passed to `species_or_fam_name`.
             # e.g. rank_col = 'Species' when `species_or_fam_name` == 'Homo_sapiens'.
             rank_col = ''.join(Scatter.DATA.columns[(Scatter.DATA == species_or_fam_name).any()])
@@ -318,51 +429,60 @@ class Scatter(object):
             if edgecolor is None:
                 edgecolor = self.edgecolor
 
-            # ensures Family legend markers are updated. 
-            if rank_col == 'Family':
-                self.colors.update({species_or_fam_name: color})
-
             if not with_highlight:
                 alpha = 1
-                
-            fig, axs = func(
-                self,
-                emph_family=species_or_fam_name, 
-                emph_edgecol=edgecolor, emph_edgewidth=linewidth,
-                alpha=alpha
-                )
 
-            # filter for `species_or_fam_name` values only. 
-            name_filt = self.data[rank_col] == species_or_fam_name
+            # ensures Family legend markers are updated. the color override is scoped to this figure, as
+            # self.colors may be the shared Scatter.new_def_colors map.
+            instance_colors = self._colors
+            if rank_col == 'Family':
+                self._colors = {**instance_colors, species_or_fam_name: color}
+
+            try:
+                fig, axs = func(
+                    self,
+                    emph_family=species_or_fam_name, 
+                    emph_edgecol=edgecolor, emph_edgewidth=linewidth,
+                    alpha=alpha
+                    )
+            finally:
+                self._colors = instance_colors
+
+            # legend handle for `species_or_fam_name` is the same on every axis, so build it once.
+            emph_handles = None
+            if legend and rank_col != 'Family':
+                if scientific_name: 
+                    legend_label = species_or_fam_name[0] + '. ' + species_or_fam_name.split('_')[1]
+                else:
+                    legend_label = species_or_fam_name.replace('_', ' ')
+
+                emph_handles = [
+                    Line2D([0], [0],
+                    color='w', marker=self.marker, markerfacecolor=color,
+                    markeredgecolor=edgecolor, markersize=4,
+                    label=legend_label
+                    )]
+
+            # filter for `species_or_fam_name` values only, applied once to each plotted column.
+            name_filt = (self.data[rank_col] == species_or_fam_name).to_numpy()
+            species_values = {
+                col: self.data[col].to_numpy()[name_filt] for col in dict.fromkeys(chain.from_iterable(self.xy))
+                }
             
             for ax_n, (x, y) in enumerate(self.xy):
                 # get data-points which correspond to `species_or_fam_name` value.
-                species_x = self.data.loc[name_filt, x]
-                species_y = self.data.loc[name_filt, y]
+                species_x, species_y = species_values[x], species_values[y]
                 
                 axs[ax_n].scatter(
                     species_x, species_y,
                     facecolors=color, edgecolors=edgecolor, marker=self.marker,
                     s=s, linewidth=linewidth, alpha=0.85
                     )
-                    
-                if legend and rank_col != 'Family':
-                    if scientific_name: 
-                        legend_label = species_or_fam_name[0] + '. ' + species_or_fam_name.split('_')[1]
-                    else:
-                        legend_label = species_or_fam_name.replace('_', ' ')
-
-                    handles = [
-                        Line2D([0], [0],
-                        color='w', marker=self.marker, markerfacecolor=color,
-                        markeredgecolor=edgecolor, markersize=4,
-                        label=legend_label
-                        )]
-
-                    for xy_pair in zip(species_x, species_y):
-                        if not any(np.isnan(element) for element in xy_pair):
-                            emph_leg = axs[ax_n].legend(loc=(0.02, 0.55), handles=handles, handletextpad=0.1)
-                            emph_leg.get_frame().set_color('white')
+
+                # legend drawn once, on axes where `species_or_fam_name` has at least one complete data-point.
+                if emph_handles and (~np.isnan(species_x) & ~np.isnan(species_y)).any():
+                    emph_leg = axs[ax_n].legend(loc=(0.02, 0.55), handles=emph_handles, handletextpad=0.1)
+                    emph_leg.get_frame().set_color('white')
                             
                 if with_arrows:
                     for x, y in zip(species_x, species_y):
@@ -387,83 +507,96 @@ class Scatter(object):
                 (each instance passed to save_plots() (and by extension, save()).
             axs (class): array of matplotlib.axes.Axes objects.
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import to_rgba_array
+
         fig, axs = plt.subplots(*self.grid, figsize=self.figsize, squeeze=False)
         axs = axs.flatten()
 
-        self.data = Scatter.DATA.copy()
-        
-        if self.logged:
-            for col in self.data.columns:
-                if self.data[col].dtype == 'float64':
-                    self.data[col] = np.log(self.data[col])
-                 
-        for ax_n, (x, y) in enumerate(self.xy):
-            if self.species_means or self.family_means:
-                groupby_col = 'Family' if self.family_means else 'Species'
-
-                col_agg_dict = {}
-                for col in self.data.columns:
-                    if self.data[col].dtype == 'float64':
-                        col_agg_dict[col] = 'mean'
-                    elif col != groupby_col:
-                        col_agg_dict[col] = 'first'
-
-                if not self.overlay_means:
-                    self.data = self.data.groupby(groupby_col).agg(col_agg_dict).reset_index()
-
-            axs[ax_n].scatter(
-                self.data[x], self.data[y],
-                c=self.data.Family.map(self.colors),
-                edgecolor=self.edgecolor, marker=self.marker, **kwargs
-                )
+        self.data = Scatter._plot_data(self.logged)
+
+        # averages are computed once per figure; either plotted in place of the data, or overlaid on every axis.
+        mean_data = None
+        if self.species_means or self.family_means:
+            groupby_col = 'Family' if self.family_means else 'Species'
+
+            # numeric columns are averaged, all others take their first value.
+            col_agg_dict = {
+                col: 'mean' if dtype.kind in 'fiu' else 'first'
+                for col, dtype in self.data.dtypes.items() if col != groupby_col
+                }
+
+            grouped_data = self.data.groupby(groupby_col).agg(col_agg_dict).reset_index()
+            if self.overlay_means:
+                mean_data = grouped_data
+            else:
+                self.data = grouped_data
+
+        # one single-color scatter per family is drawn much faster than one scatter with per-point colors.
+        # masks compare integer family codes rather than family-name strings.
+        family_codes, family_names = pd.factorize(self.data.Family)
+        uncolored = [family for family in family_names if family not in self.colors]
+        if uncolored:
+            raise ValueError(f'No color is defined for families: {", ".join(map(str, uncolored))}.\n')
 
-            if self.overlay_means_means:
-                mean_data = self.data.groupby(groupby_col).agg(col_agg_dict).reset_index()
+        code_of = {family: code for code, family in enumerate(family_names)}
+        family_masks = {family: family_codes == code_of[family] for family in self.colors if family in code_of}
+        # colors are converted to RGBA once per figure, rather than parsed by every scatter call. each is kept as a
+        # (1, 4) row, so it is never mistaken for four per-point values.
+        family_rgba = dict(zip(family_masks, to_rgba_array([self.colors[family] for family in family_masks])[:, None]))
 
+        if mean_data is not None:
+            # overlaid means take their colors from a per-family RGBA table, indexed by family code.
+            mean_codes, mean_families = pd.factorize(mean_data.Family)
+            mean_colors = to_rgba_array([self.colors[family] for family in mean_families])[mean_codes]
+
+        # handles for main legend. legend reflects emphasization of family.
+        handles = self._legend_handles(emph_family, emph_edgecol, emph_edgewidth)
+
+        # columns recur across pairwise combinations, so extract each one once per figure.
+        col_values = {col: self.data[col].to_numpy() for col in dict.fromkeys(chain.from_iterable(self.xy))}
+
+        for ax_n, (x, y) in enumerate(self.xy):
+            x_values, y_values = col_values[x], col_values[y]
+            for family, mask in family_masks.items():
+                axs[ax_n].scatter(
+                    x_values[mask], y_values[mask],
+                    c=family_rgba[family],
+                    edgecolor=self.edgecolor, marker=self.marker, **kwargs
+                    )
+
+            if mean_data is not None:
                 # average points for each family/species drawn on top of main plot. 
                 axs[ax_n].scatter(
                     mean_data[x], mean_data[y],
-                    c=mean_data.Family.map(self.colors),
+                    c=mean_colors,
                     edgecolor='mediumblue', marker='s', linewidth=2, s=35, **kwargs
                     )
  
-            # handles for main legend. legend reflects emphasization of family. 
-            handles = [
-                Line2D([0], [0],
-                color='w', marker=self.marker, markerfacecolor=color,
-                markeredgecolor=emph_edgecol if family == emph_family else self.edgecolor,
-                markeredgewidth=emph_edgewidth if family == emph_family else 0.5,
-                markersize=4, label=family
-                ) for family, color in self.colors.items()
-                ]
-
-            ax_legend = axs[ax_n].legend(
-                title='Family',
-                loc=self.legend_loc,
-                handles=handles,
-                handletextpad=0.1,
-                )
-            ax_legend = axs[ax_n].add_artist(ax_legend)
-            ax_legend.get_frame().set_color('white')
+            # axis ticks are applied in the same Axes.set() call as the labels.
+            tick_props = {}
+            if self.logged:
+                for prop, values in (('xticks', x_values), ('yticks', y_values)):
+                    # values greater than 0 taken due to weird behavior when plots are not emphasised.
+                    ticks = np.arange(np.floor(np.nanmin(values)), np.ceil(np.nanmax(values)), 0.5)
+                    tick_props[prop] = ticks[ticks >= -0.5]
 
             axs[ax_n].set(
-                    title=f'{"Logged " if self.logged else ""}Primate {self.xy[ax_n][0]} against\n{self.xy[ax_n][1]}',
-                    xlabel=f'{"Log " if self.logged else ""}{self.xy[ax_n][0]}',
-                    ylabel=f'{"Log " if self.logged else ""}{self.xy[ax_n][1]}'
+                    title=f'{"Logged " if self.logged else ""}Primate {x} against\n{y}',
+                    xlabel=f'{"Log " if self.logged else ""}{x}',
+                    ylabel=f'{"Log " if self.logged else ""}{y}',
+                    **tick_props
                     )
-        
-            if self.logged:
-                for var in (x, y):
-                    # values greater than 0 taken due to weird behavior when plots are not emphasised.
-                    ticks = [tick for tick in np.arange(
-                        np.floor(min(self.data[var].dropna())),
-                        np.ceil(max(self.data[var].dropna())),
-                        0.5) if tick >= -0.5]
 
-                    if var == x:
-                        axs[ax_n].set_xticks(ticks)
-                    else:
-                        axs[ax_n].set_yticks(ticks)
+        # every axis shares the same family color map, so the main legend is drawn once, on the first axis.
+        ax_legend = axs[0].legend(
+            title='Family',
+            loc=self.legend_loc,
+            handles=handles,
+            handletextpad=0.1,
+            )
+        ax_legend = axs[0].add_artist(ax_legend)
+        ax_legend.get_frame().set_color('white')
 
         fig.tight_layout(pad=0.4, w_pad=0.5, h_pad=1.0)
 
@@ -476,12 +609,73 @@ class Scatter(object):
 
         return fig, axs
 
+    @classmethod
+    def _plot_data(cls, logged=False) -> pd.DataFrame:
+        """Get a copy of Scatter.DATA, with numeric columns logged if `logged` is True.
+
+        Args:
+            logged (bool, optional): log (True) or leave unlogged (False) numeric columns. Defaults to False.
+
+        Returns:
+            data (pandas.DataFrame): dataframe to be plotted.
+        """
+        data = cls.DATA.copy()
+        if logged:
+            # all numeric columns are logged in one pass. non-positive values have no log; plot them as missing
+            # rather than as -inf.
+            numeric_cols = data.columns[[dtype.kind in 'fiu' for dtype in data.dtypes]]
+            values = data[numeric_cols].to_numpy(dtype='float64')
+            data[numeric_cols] = np.log(values, where=values > 0, out=np.full_like(values, np.nan))
+
+        return data
+
+    def _legend_handles(self, emph_family=None, emph_edgecol=None, emph_edgewidth=0.5) -> tuple:
+        """Get the main legend handles for the current marker, edgecolor and color map. Handles are cached in
+        Scatter.__handles, so figures sharing the same legend appearance reuse the same Line2D objects. The key is
+        built from the color items rather than the identity of the color map, as Scatter.new_def_colors is updated
+        in place. Handles for unhashable colors or markers (e.g. RGB lists) are built uncached.
+
+        Args:
+            emph_family (str, optional): family name whose handle is drawn with emphasized edges. Defaults to None.
+            emph_edgecol (str, optional): edge color of the emphasized family's handle. Defaults to None.
+            emph_edgewidth (float, optional): edge width of the emphasized family's handle. Defaults to 0.5.
+
+        Returns:
+            handles (tuple of matplotlib.lines.Line2D): one legend handle per family in property `colors`.
+        """
+        from matplotlib.lines import Line2D
+
+        key = (
+            self.marker, self.edgecolor, tuple(self.colors.items()),
+            emph_family, emph_edgecol, emph_edgewidth
+            )
+        try:
+            handles = Scatter.__handles.get(key)
+        except TypeError:
+            key = handles = None
+
+        if handles is None:
+            handles = tuple(
+                Line2D([0], [0],
+                color='w', marker=self.marker, markerfacecolor=color,
+                markeredgecolor=emph_edgecol if family == emph_family else self.edgecolor,
+                markeredgewidth=emph_edgewidth if family == emph_family else 0.5,
+                markersize=4, label=family
+                ) for family, color in self.colors.items()
+                )
+            if key is not None:
+                Scatter.__handles[key] = handles
+
+        return handles
+
     def display(self, **kwargs) -> None:
         """Plot and output cbpmodels.Scatter instance to it's own window.
 
         Args:
             **kwargs: matplotlib.axes.Axes.scatter properties.
         """
+        import matplotlib.pyplot as plt
+
         if self.emph_arg:
             Scatter.plot(self, self.emph_arg, **self.emph_kwargs, **kwargs)
         else:
@@ -579,6 +773,12 @@ class Scatter(object):
                 f' {cls.DATA.Family.nunique()} unique families.'
                 )
 
+        # nothing to draw, so skip matplotlib altogether.
+        if not (surface_area_boxplot or volume_boxplot):
+            return
+
+        import matplotlib.pyplot as plt
+
         if surface_area_boxplot:
             cols = [col for col in cls.DATA.columns if 'Surface' and 'Area' in col]
             cls.DATA[cols].plot(kind='box')
@@ -599,8 +799,15 @@ class Scatter(object):
         """Save instance of cbpmodels.Scatter instance using Scatter.save_plots()."""
         Scatter.save_plots(self)
 
+    def _figure(self):
+        """Plot the instance, with emphasis if `emphasize()` was called on it, and return the matplotlib figure."""
+        if self.emph_arg:
+            return Scatter.plot(self, self.emph_arg, **self.emph_kwargs)
+
+        return Scatter.plot.unemphasized(self)[0]
+
     @classmethod
-    def save_plots(cls, *args, every=False) -> None:
+    def save_plots(cls, *args, every=False, processes=None, headless=False) -> None:
         """Saves simple/log plots to respective folders.
 
         Each figure's save file is named as such:
@@ -612,6 +819,13 @@ class Scatter(object):
         Args:
             *args (cbpmodels.Scatter instance): any number of cbpmodels.Scatter instances.
             every (bool, optional): if True, save every object of cbpmodels.Scatter. Defaults to False.
+            processes (int, optional): number of worker processes used to render figures in parallel, when saving
+                more than one figure. Defaults to None (figures are rendered one at a time in this process). Workers
+                are started with 'spawn', so scripts passing `processes` must guard their entry point with
+                `if __name__ == '__main__':`.
+            headless (bool, optional): if True, switch matplotlib to the non-interactive Agg backend before
+                rendering, which is faster for file-only output. The backend stays Agg for the rest of the session,
+                so figures can no longer be displayed in windows. Defaults to False.
         
         Raises:
             TypeError: if no objects are specified when `every` is False, or when objects passed to save_plots() are not
@@ -629,41 +843,94 @@ class Scatter(object):
                     )
             figures = args
 
-        for figure in figures:
-            if figure.emph_arg:
-                fig = figure.plot(figure.emph_arg, **figure.emph_kwargs)
-            else:
-                fig = Scatter.plot.unemphasized(figure)[0]
-                
-            log_or_not = "Log" if figure.logged else "Simple"
-            is_custom = "Default" if figure.xy == Scatter.xy_pairs(Scatter.def_pairs) else log_or_not
-            len_custom = str(len(figure.xy)) + " " if figure.xy != Scatter.xy_pairs(Scatter.def_pairs) else ""
-            is_plural = "s" if len(figure.xy) > 1 else ""
-            emph_detail = figure.emph_arg.replace('_', ' ') + " emphasized -" if figure.emph_arg else ""
-
-            save_folder = Path(Path.cwd(), f'Saved {log_or_not} Plots')
-            if not save_folder.is_dir():
-                Path(save_folder).mkdir(parents=True)
-
-            png_id = 1
-            while Path(f'Saved {log_or_not} Plots/{len_custom}{is_custom} Plot{is_plural} - #{png_id:d}.png').exists():
-                png_id += 1
-            fig.savefig(f'Saved {log_or_not} Plots/{len_custom}{is_custom} Plot{is_plural} - #{png_id:d}.png')
-
-            var_list = "\n".join(str(x) for x in figure.xy)
-            with open(f'Saved {log_or_not} Plots/{log_or_not.upper()}_PLOT_DETAILS.txt', 'a') as save_details:
-                save_details.write(
+        if headless:
+            import matplotlib
+            matplotlib.use('Agg')
+
+        import matplotlib.pyplot as plt
+
+        next_png_ids = {}
+        details_files = {}
+        with ExitStack() as details_stack:
+            # figures are rendered to PNG bytes by worker processes, in order; file names and details are still
+            # written here, so save ids are assigned exactly as in a serial save.
+            rendered_pngs = None
+            if processes and processes > 1 and len(figures) > 1:
+                pool = details_stack.enter_context(get_context('spawn').Pool(
+                    min(processes, len(figures)), initializer=_init_render_worker, initargs=(cls.DATA,)
+                    ))
+                rendered_pngs = pool.imap(_render_png, figures)
+
+            for figure in figures:
+                is_default = figure._is_default_xy
+                log_or_not, folder_name, details_name = _SAVE_NAMES[bool(figure.logged)]
+                is_custom = "Default" if is_default else log_or_not
+                len_custom = str(len(figure.xy)) + " " if not is_default else ""
+                is_plural = "s" if len(figure.xy) > 1 else ""
+                emph_detail = figure.emph_arg.replace('_', ' ') + " emphasized -" if figure.emph_arg else ""
+
+                save_folder = Path(Path.cwd(), folder_name)
+                if not save_folder.is_dir():
+                    Path(save_folder).mkdir(parents=True)
+
+                # the folder is scanned once per file-name prefix per batch; later ids follow on from the cached one.
+                png_prefix = f'{len_custom}{is_custom} Plot{is_plural}'
+                png_key = save_folder, png_prefix
+                if png_key not in next_png_ids:
+                    next_png_ids[png_key] = Scatter._next_png_id(save_folder, png_prefix)
+                png_id = next_png_ids[png_key]
+                next_png_ids[png_key] += 1
+
+                png_path = save_folder / f'{len_custom}{is_custom} Plot{is_plural} - #{png_id:d}.png'
+                if rendered_pngs is None:
+                    # saved figures are closed, so pyplot does not keep every figure of the session alive.
+                    fig = figure._figure()
+                    fig.savefig(png_path, pil_kwargs=_PNG_KWARGS)
+                    plt.close(fig)
+                else:
+                    png_path.write_bytes(next(rendered_pngs))
+
+                # each details file is opened once per batch, and closed by `details_stack` when the batch ends. the
+                # large buffer lets a whole batch of records reach the file in as few writes as possible.
+                details_path = save_folder / details_name
+                if details_path not in details_files:
+                    details_files[details_path] = details_stack.enter_context(
+                        open(details_path, 'a', buffering=64 * 1024)
+                        )
+
+                var_list = "\n".join(str(x) for x in figure.xy)
+                details_files[details_path].write(
                     f'{len_custom}{is_custom} Plot{is_plural} - #{png_id:d} - {emph_detail}'
                     f'\n{var_list}\n'
-                    f'- Figure Created on {datetime.now().strftime("%d-%m-%Y at %H:%M:%S")}\n'
+                    f'- Figure Created on {time.strftime(_TIMESTAMP_FORMAT)}\n'
                     f'------------------------------------------------------\n'
                     )
-                
+
                 print(
-                    f'{is_custom + " " + log_or_not if figure.xy == Scatter.xy_pairs(Scatter.def_pairs) else is_custom}'
+                    f'{is_custom + " " + log_or_not if is_default else is_custom}'
                     f' Plot{is_plural} saved to {save_folder}\n'
                     )
 
+    @staticmethod
+    def _next_png_id(save_folder: Path, png_prefix: str) -> int:
+        """Get the next free save id for figures named '`png_prefix` - #(id).png' in `save_folder`, from a single
+        directory read rather than probing each id in turn.
+
+        Args:
+            save_folder (pathlib.Path): 'Saved Simple Plots' or 'Saved Log Plots' folder.
+            png_prefix (str): file-name prefix, e.g. '3 Simple Plots' or 'Default Plots'.
+
+        Returns:
+            png_id (int): one more than the highest existing id for `png_prefix`, or 1 if there are none.
+        """
+        with os.scandir(save_folder) as entries:
+            png_ids = [
+                int(match.group(2)) for match in (_PNG_NAME.fullmatch(entry.name) for entry in entries)
+                if match and match.group(1) == png_prefix
+                ]
+
+        return max(png_ids, default=0) + 1
+
     @staticmethod    
     def delete_folder(logged=False) -> None:
         """Deletes simple or log save folder depending on if logged=True is passed as an argument.
@@ -671,7 +938,7 @@ class Scatter(object):
         Args:
             logged (bool): determines deletion of simple plot (False), or log plot save folders (True).
         """ 
-        folder = Path(Path.cwd(), f'Saved {"Log" if logged else "Simple"} Plots')
+        folder = Path(Path.cwd(), _SAVE_NAMES[bool(logged)][1])
 
         try:
             shutil.rmtree(folder)
@@ -683,17 +950,19 @@ class Regression(Scatter):
 #     def plot_regression():
 #             """Plots linear regression line for the volume-against-volume plot."""
 #             plot_variables((('Cerebrum Volume', 'Cerebellum Volume'),))
-#             data_2 = data[['Cerebellum Volume', 'Cerebrum Volume']].copy(deep=False)
-
-#             data_2.dropna(inplace=True)
+#             x = data['Cerebrum Volume'].to_numpy()
+#             y = data['Cerebellum Volume'].to_numpy()
 
-#             predict = 'Cerebellum Volume'
-#             x = np.array(data_2.drop([predict], axis=1))
-#             y = np.array(data_2[predict])
+#             # fit only the rows where both volumes are present.
+#             both_present = ~(np.isnan(x) | np.isnan(y))
+#             x, y = x[both_present], y[both_present]
 
-#             model = np.polyfit(x[:, 0], y, 1)
-#             predict = np.poly1d(model)
+#             # closed-form least squares for a straight line; no Vandermonde matrix or lstsq needed.
+#             x_mean, y_mean = x.mean(), y.mean()
+#             x_dev = x - x_mean
+#             slope = (x_dev * (y - y_mean)).sum() / (x_dev ** 2).sum()
+#             intercept = y_mean - slope * x_mean
 
-#             x_lin_reg = range(0, 1600)
-#             y_lin_reg = predict(x_lin_reg)
+#             x_lin_reg = np.arange(0, 1600)
+#             y_lin_reg = slope * x_lin_reg + intercept
 #             plt.plot(x_lin_reg, y_lin_reg, c='k')